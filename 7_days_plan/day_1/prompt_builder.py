@@ -0,0 +1,207 @@
+"""
+Day 1: Cache-Friendly Prompt Builder
+====================================
+
+English Description:
+The prompt template shown in prompt_inspector.py is re-rendered as one string
+on every query, even though the instructions, `{dataframe_head}` and
+`{column_descriptions}` never change for a given dataset. This module splits
+the template into a static prefix and a variable suffix: the prefix is rendered
+once per dataset version, interned and reused byte-for-byte, and only the
+conversation history and user query are rendered per request. Keeping the
+prefix identical across requests lets provider-side prompt caching (e.g. Azure
+OpenAI / OpenAI automatic prefix caching) reuse it.
+
+Key Features:
+- Static sections precomputed and interned per dataset version
+- Byte-stable prefix placed ahead of the conversation and query
+- Only the variable suffix rendered per request
+- Report of the expected prefix-cache hit rate
+
+中文描述：
+prompt_inspector.py 中展示的提示模板在每次查询时都会被整体重新渲染，
+但对于同一个数据集，说明部分、`{dataframe_head}` 和 `{column_descriptions}`
+从不改变。本模块将模板拆分为静态前缀和可变后缀：前缀按数据集版本只渲染一次，
+驻留后逐字节复用；每次请求只渲染对话历史和用户查询。
+保持前缀在请求之间完全一致，可以让服务端的提示缓存复用它。
+
+主要功能：
+- 按数据集版本预计算并驻留静态部分
+- 字节稳定的前缀位于对话和查询之前
+- 每次请求只渲染可变后缀
+- 报告预期的前缀缓存命中率
+
+Usage: python prompt_builder.py
+"""
+
+import hashlib
+import sys
+
+import pandas as pd
+
+# Static part of the template: identical for every query on the same dataset
+INSTRUCTIONS = """### Instructions
+You are a Python data analyst assistant. Your task is to write a single, clean Python script to answer the user's question using the provided DataFrame `df`.
+
+- You have access to the following dependencies: pandas, plotly.express, pyecharts.charts.
+- The user has provided column descriptions. Use them to better understand the data.
+- The final result should be assigned to the `result` variable.
+- Do not add comments or extra explanations.
+- You can only use the variable `df` which is already loaded.
+"""
+
+DATA_TEMPLATE = """
+### Data
+The DataFrame `df` has the following structure:
+{dataframe_head}
+
+Column Descriptions:
+{column_descriptions}
+"""
+
+# Variable part of the template: rendered for every request
+SUFFIX_TEMPLATE = """
+### Previous Conversation
+{conversation_history}
+
+### User Query
+{user_query}
+
+### Generated Python Code
+```python
+"""
+
+# Providers only cache prompts whose prefix is at least this many tokens
+MIN_CACHEABLE_TOKENS = 1024
+
+
+def estimate_tokens(text):
+    """Rough token estimate (about 4 characters per token)"""
+    return len(text) // 4
+
+
+def dataset_fingerprint(df, column_descriptions):
+    """Compute a version key from the DataFrame contents and column descriptions"""
+    digest = hashlib.sha256()
+    digest.update(repr(list(df.columns)).encode("utf-8"))
+    digest.update(repr([str(dtype) for dtype in df.dtypes]).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    digest.update(repr(sorted(column_descriptions.items())).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class CachedPromptBuilder:
+    """Build prompts as a cached static prefix plus a per-request suffix"""
+
+    def __init__(self, head_rows=5):
+        self.head_rows = head_rows
+        self._prefixes = {}
+        self._stats = {}
+
+    def _render_prefix(self, df, column_descriptions):
+        """Render the static sections deterministically"""
+        dataframe_head = df.head(self.head_rows).to_csv(index=False).strip()
+        descriptions = "\n".join(
+            f"- {column}: {column_descriptions[column]}"
+            for column in df.columns
+            if column in column_descriptions
+        )
+        prefix = INSTRUCTIONS + DATA_TEMPLATE.format(
+            dataframe_head=dataframe_head,
+            column_descriptions=descriptions,
+        )
+        return sys.intern(prefix)
+
+    def register_dataset(self, df, column_descriptions, dataset_version=None):
+        """Precompute the static prefix for a dataset and return its version key"""
+        if dataset_version is None:
+            dataset_version = dataset_fingerprint(df, column_descriptions)
+        if dataset_version not in self._prefixes:
+            self._prefixes[dataset_version] = self._render_prefix(
+                df, column_descriptions
+            )
+            self._stats[dataset_version] = {"requests": 0, "total_tokens": 0}
+        return dataset_version
+
+    def build(self, dataset_version, user_query, conversation_history=""):
+        """Return the full prompt, rendering only the variable suffix"""
+        if dataset_version not in self._prefixes:
+            raise KeyError(
+                f"Unknown dataset version '{dataset_version}', "
+                "call register_dataset() first"
+            )
+        prefix = self._prefixes[dataset_version]
+        suffix = SUFFIX_TEMPLATE.format(
+            conversation_history=conversation_history or "(none)",
+            user_query=user_query,
+        )
+        prompt = prefix + suffix
+
+        stats = self._stats[dataset_version]
+        stats["requests"] += 1
+        stats["total_tokens"] += estimate_tokens(prompt)
+        return prompt
+
+    def cache_report(self, dataset_version):
+        """Report the expected provider prefix-cache hit rate for a dataset"""
+        stats = self._stats[dataset_version]
+        prefix_tokens = estimate_tokens(self._prefixes[dataset_version])
+        requests = stats["requests"]
+        cacheable = prefix_tokens >= MIN_CACHEABLE_TOKENS
+
+        # The first request warms the cache, every later one can reuse the prefix
+        hits = max(requests - 1, 0) if cacheable else 0
+        cached_tokens = hits * prefix_tokens
+        return {
+            "dataset_version": dataset_version,
+            "requests": requests,
+            "prefix_tokens": prefix_tokens,
+            "cacheable": cacheable,
+            "request_hit_rate": hits / requests if requests else 0.0,
+            "token_hit_rate": (
+                cached_tokens / stats["total_tokens"] if stats["total_tokens"] else 0.0
+            ),
+        }
+
+
+if __name__ == "__main__":
+    data = {
+        "OrderID": [1, 2, 3, 4, 5],
+        "CustomerID": ["C001", "C002", "C003", "C004", "C005"],
+        "ProductCategory": ["Electronics", "Clothing", "Electronics", "Books", "Clothing"],
+        "SalesAmount": [1200.50, 75.20, 850.00, 45.99, 120.75],
+        "OrderDate": ["2024-01-15", "2024-01-16", "2024-01-17", "2024-01-18", "2024-01-19"],
+        "Region": ["East", "West", "North", "South", "East"],
+    }
+    column_descriptions = {
+        "OrderID": "A unique identifier for each sales order.",
+        "CustomerID": "Identifier for the customer who placed the order.",
+        "ProductCategory": "The category of the product sold.",
+        "SalesAmount": "The monetary value of the sale in USD.",
+        "OrderDate": "The date when the order was placed.",
+        "Region": "The geographical region where the sale occurred.",
+    }
+    df = pd.DataFrame(data)
+
+    builder = CachedPromptBuilder()
+    version = builder.register_dataset(df, column_descriptions)
+
+    history = ""
+    for query in [
+        "What is the total sales amount?",
+        "Which region has the highest sales?",
+        "Show the average sales per product category.",
+    ]:
+        prompt = builder.build(version, query, conversation_history=history)
+        history += f"User: {query}\n"
+
+    print("=" * 50)
+    print("CACHE-FRIENDLY PROMPT (last request)")
+    print("=" * 50)
+    print(prompt)
+
+    print("=" * 50)
+    print("PREFIX CACHE REPORT")
+    print("=" * 50)
+    for key, value in builder.cache_report(version).items():
+        print(f"{key}: {value}")
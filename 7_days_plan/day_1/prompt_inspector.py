@@ -36,6 +36,7 @@ from pandasai_openai import AzureOpenAI
 import os
 import pandas as pd
 import logging
+from prompt_builder import CachedPromptBuilder
 
 # Set up logging to see the prompts
 logging.basicConfig(level=logging.DEBUG)
@@ -192,3 +193,19 @@ print("You can modify the system prompt through configuration instead.")
 
 print("To use custom prompts, create a custom prompt class and pass it to the config.")
 print("This allows you to control exactly what the LLM sees and how it responds.")
+
+print("\n" + "=" * 50)
+print("CACHE-FRIENDLY PROMPT LAYOUT")
+print("=" * 50)
+
+# Render the static sections once per dataset version and reuse them as a
+# byte-stable prefix; only the conversation and query change per request
+builder = CachedPromptBuilder()
+version = builder.register_dataset(df, column_descriptions)
+prompt = builder.build(version, "What is the total sales amount?")
+builder.build(version, "Which region has the highest sales?")
+
+print(prompt)
+print("Prefix cache report:")
+for key, value in builder.cache_report(version).items():
+    print(f"  {key}: {value}")